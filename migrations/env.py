@@ -1,19 +1,17 @@
 import asyncio
 import logging
-from os import getenv
-from urllib.parse import quote_plus
+from functools import lru_cache
 
 from alembic import context
+from pydantic import ValidationError
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 # Импортируем базовую модель SQLAlchemy
+# Пакет `src.api.models` импортирует все модели, поэтому они уже зарегистрированы в Base.metadata
 from src.api.models import Base
 
-# Импортируем все модели, чтобы они зарегистрировались в Base.metadata
-import src.api.models
-
 from src.core_shared.logging_setup import setup_logger
 
 # Настройка логирования
@@ -21,16 +19,25 @@ from src.core_shared.logging_setup import setup_logger
 # Получаем базовый логгер Loguru
 loguru_logger = setup_logger("Alembic")
 
+# `setup_logger` уже возвращает логгер с привязанным именем сервиса, повторный `bind` не нужен
+logger = loguru_logger
+
+
+@lru_cache(maxsize=16)
+def _map_level(levelname: str, levelno: int) -> str | int:
+    """Возвращает уровень Loguru, соответствующий уровню стандартного logging (с кэшированием)."""
+    try:
+        return loguru_logger.level(levelname).name
+    except ValueError:
+        return levelno
+
 
 class InterceptHandler(logging.Handler):
     """Перехватывает логи стандартного модуля logging и перенаправляет их в Loguru."""
 
-    # Получаем соответствующий уровень логгера Loguru
     def emit(self, record):
-        try:
-            level = loguru_logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+        # Получаем соответствующий уровень логгера Loguru
+        level = _map_level(record.levelname, record.levelno)
 
         # Ищем, откуда был вызван лог, чтобы правильно отобразить stack trace
         frame, depth = logging.currentframe(), 2
@@ -39,19 +46,16 @@ class InterceptHandler(logging.Handler):
             frame = frame.f_back
             depth += 1
 
-        logger_opt = loguru_logger.bind(service_name="Alembic").opt(depth=depth, exception=record.exc_info)
-        logger_opt.log(level, record.getMessage())
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
 
 
 # Подменяем logging
-logging.basicConfig(handlers=[InterceptHandler()], level=logging.INFO, force=True)
+# Уровень задаем и самому обработчику, чтобы лишние записи отсекались до вызова `emit`
+logging.basicConfig(handlers=[InterceptHandler(level=logging.INFO)], level=logging.INFO, force=True)
 
 # Отключаем лишний шум
 logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
-# Логгер для использования внутри этого файла
-logger = loguru_logger.bind(service_name="Alembic")
-
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -60,42 +64,20 @@ config = context.config
 target_metadata = Base.metadata
 
 
-# Функция для формирования URL БД
-def get_database_url() -> str:
-    """
-    Читает переменные окружения и формирует URL базы данных.
-
-    Raises:
-        ValueError, если одна или несколько переменных окружения отсутствуют.
-    """
-    # Получаем переменные окружения
-    db_user = getenv("DB_USER")
-    db_password = getenv("DB_PASSWORD")
-    db_host = getenv("DB_HOST")
-    db_port = getenv("DB_PORT")
-    db_name = getenv("DB_NAME")
-
-    # Проверка, что все переменные установлены
-    if not all([db_user, db_password, db_host, db_port, db_name]):
-        raise ValueError("Отсутствуют переменные окружения для базы данных (DB_USER, DB_PASSWORD, ...)")
-
-    # Экранируем пользователя и пароль, чтобы спецсимволы не ломали URL
-    encoded_user = quote_plus(db_user)
-    encoded_password = quote_plus(db_password)
-
-    return f"postgresql+psycopg://{encoded_user}:{encoded_password}@{db_host}:{db_port}/{db_name}"
-
-
 # Сначала пытаемся получить URL БД из существующей конфигурации
 # Это позволяет тестам в conftest.py переопределять его
 current_db_url = config.get_alembic_option("sqlalchemy.url")
 
-# Если URL БД не был установлен извне, формируем его из переменных окружения
+# Если URL БД не был установлен извне, берем его из настроек приложения
 if not current_db_url:
     try:
-        current_db_url = get_database_url()
-    except ValueError as db_url_exc:
-        logger.error(f"Ошибка конфигурации: {db_url_exc}")
+        # Импортируем настройки приложения (единый источник URL БД) только здесь:
+        # экземпляр настроек создается при импорте модуля и требует переменных окружения DB_*
+        from src.api.core.config import settings
+
+        current_db_url = settings.DB_URL
+    except ValidationError as db_url_exc:
+        logger.error(f"Ошибка конфигурации БД (проверьте переменные окружения DB_*): {db_url_exc}")
         raise db_url_exc
 
 
@@ -0,0 +1,29 @@
+"""drop redundant id index
+
+Revision ID: 3e8a6f0c1d27
+Revises: f3f5016370a0
+Create Date: 2026-10-15 14:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3e8a6f0c1d27"
+down_revision: Union[str, Sequence[str], None] = "f3f5016370a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Первичный ключ уже индексирован (pk_urllinks), отдельный индекс по id избыточен
+    op.drop_index(op.f("ix_urllinks_id"), table_name="urllinks")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_urllinks_id"), "urllinks", ["id"], unique=False)
@@ -1,8 +1,10 @@
 """Конфигурация приложения."""
 
+from functools import lru_cache
+from typing import Any
 from urllib.parse import quote_plus
 
-from pydantic import Field, computed_field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -36,9 +38,39 @@ class Settings(BaseSettings):
     )
     DB_PORT: int = Field(default=5432, description="Порт хоста базы данных")
 
+    # Настройки пула соединений с БД
+    DB_POOL_SIZE: int = Field(default=20, description="Количество постоянных соединений в пуле")
+    DB_MAX_OVERFLOW: int = Field(default=10, description="Количество дополнительных соединений сверх размера пула")
+    DB_POOL_TIMEOUT: int = Field(default=30, description="Время ожидания свободного соединения из пула (в секундах)")
+    DB_POOL_RECYCLE: int = Field(default=1800, description="Время жизни соединения до переподключения (в секундах)")
+    DB_POOL_PRE_PING: bool = Field(
+        default=False,
+        description="Проверять соединение запросом к БД при каждом получении из пула",
+    )
+    DB_PREPARE_THRESHOLD: int = Field(
+        default=2,
+        description="Количество выполнений запроса, после которого psycopg готовит его на сервере (prepared statement)",
+    )
+
     # Настройки режима разработки/тестирования (по умолчанию `False` для продакшен)
     DEBUG: bool = Field(default=False, description="Режим разработки/тестирования")
 
+    # Интервал фоновой проверки доступности БД для health check
+    HEALTH_TTL: float = Field(default=5.0, description="Интервал фоновой проверки доступности БД (в секундах)")
+
+    # Размер in-process кэша `short_code -> original_url` для редиректов
+    URL_CACHE_SIZE: int = Field(default=10_000, description="Максимальное количество ссылок в кэше (0 - отключен)")
+
+    # Интервал пакетной записи счетчиков переходов в БД
+    CLICK_FLUSH_INTERVAL: float = Field(default=0.2, description="Интервал записи счетчиков переходов (в секундах)")
+    CLICK_FLUSH_MAX_PENDING: int = Field(
+        default=500,
+        description="Количество ссылок в буфере счетчиков, при котором запись выполняется досрочно",
+    )
+
+    # Размер пула потоков AnyIO (синхронные обработчики и зависимости FastAPI)
+    THREAD_POOL_SIZE: int = Field(default=100, description="Максимальное количество потоков для синхронного кода")
+
     # Настройки логирования
     LOG_LEVEL: str = Field(default="INFO", description="Уровень логирования")
     LOG_ROTATION: str = Field(default="10 MB", description="Размер файла логов в мегабайтах")
@@ -46,26 +78,42 @@ class Settings(BaseSettings):
 
     # --- Вычисляемые поля ---
 
-    # Формируем URL основной базы данных
-    @computed_field(repr=False)
-    def DB_URL(self) -> str:
-        """Собирает URL для SQLAlchemy."""
+    # URL основной базы данных (вычисляется один раз при создании настроек)
+    _db_url: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Собирает URL для SQLAlchemy один раз после валидации полей."""
 
         # Экранируем имя пользователя и пароль, чтобы спецсимволы не ломали URL
         encoded_user = quote_plus(self.DB_USER)
         encoded_password = quote_plus(self.DB_PASSWORD)
 
-        db_url = f"postgresql+psycopg://{encoded_user}:{encoded_password}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        self._db_url = (
+            f"postgresql+psycopg://{encoded_user}:{encoded_password}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        )
 
-        return db_url
+    @property
+    def DB_URL(self) -> str:
+        """URL основной базы данных для SQLAlchemy."""
+        return self._db_url
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
-        case_sensitive=False,  # Имена переменных окружения не чувствительны к регистру
+        case_sensitive=True,  # Имена переменных окружения задаются строго в верхнем регистре (как поля)
         extra="ignore",  # Игнорировать лишние переменные .env
     )
 
 
-# Создаем глобальный экземпляр настроек
-settings = Settings()  # type: ignore[call-arg]
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Возвращает единственный экземпляр настроек приложения.
+
+    Настройки (переменные окружения и `.env`) читаются только при первом вызове.
+    """
+    return Settings()  # type: ignore[call-arg]
+
+
+# Глобальный экземпляр настроек
+settings = get_settings()
@@ -1,5 +1,6 @@
 """Настройка подключения к БД."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
@@ -29,60 +30,132 @@ class Database:
         """Инициализирует менеджер с пустыми подключениями."""
 
         self.engine: AsyncEngine | None = None
+        # Отдельный движок с одним соединением для проверки доступности БД (не зависит от загрузки основного пула)
+        self.health_engine: AsyncEngine | None = None
         self.session_factory: async_sessionmaker[AsyncSession] | None = None
+        # Флаг готовности БД (результат последней проверки подключения, None - проверка еще не выполнялась)
+        self.ready: bool | None = None
 
-    async def _verify_connection(self) -> None:
+    async def verify(self) -> bool:
         """
-        Вспомогательный метод.
-        Проверяет работоспособность подключения к БД.
+        Проверяет работоспособность подключения к БД и обновляет флаг готовности `ready`.
+
+        Запрос выполняется через отдельное соединение (`health_engine`), а не через основной пул:
+        при исчерпании пула запросами проверка не ждет свободного соединения и не дает ложный отказ.
+        Не выбрасывает исключений при недоступности БД, поэтому может выполняться
+        в фоне (например, после старта приложения) без блокировки запуска.
+        Логирует только изменение состояния (потерю и восстановление подключения).
+
+        Returns:
+            bool: True - БД доступна, False - нет.
 
         Raises:
-            RuntimeError: Если проверка подключения не удалась.
+            RuntimeError: При вызове до инициализации подключения (`db.connect`).
         """
 
-        if not self.session_factory:
-            raise RuntimeError("Фабрика сессий не инициализирована.")
+        if not self.health_engine:
+            raise RuntimeError("Движок БД не инициализирован.")
 
         try:
-            async with self.session_factory() as session:
+            async with self.health_engine.connect() as connection:
                 # Выполняем простой и быстрый запрос к БД для проверки соединения
-                await session.execute(text("SELECT 1"))
-            log.debug("✅ Проверка подключения к БД прошла успешно.")
+                await connection.execute(text("SELECT 1"))
         except Exception as exc:
-            log.critical(f"❌ Ошибка подключения к БД: {exc}", exc_info=True)
-            raise RuntimeError("Не удалось проверить подключение к БД.") from exc
+            if self.ready is not False:
+                # Полный трейсбек логируем только в режиме разработки/тестирования
+                log.opt(exception=exc if settings.DEBUG else None).critical(f"❌ Ошибка подключения к БД: {exc}")
+            self.ready = False
+        else:
+            if not self.ready:
+                log.success("✅ Подключение к БД установлено.")
+            self.ready = True
+
+        return self.ready
+
+    async def warm_up(self, size: int) -> None:
+        """
+        Заранее открывает `size` соединений пула, чтобы первые запросы не тратили время на их установку.
+
+        Соединения открываются параллельно и сразу возвращаются в пул.
+        Не выбрасывает исключений при недоступности БД (прогрев лишь оптимизация).
+
+        Args:
+            size (int): Количество открываемых соединений (как правило, размер пула).
+
+        Raises:
+            RuntimeError: При вызове до инициализации подключения (`db.connect`).
+        """
+
+        if not self.engine:
+            raise RuntimeError("Движок БД не инициализирован.")
+
+        engine = self.engine
+
+        async def _open_one() -> None:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        results = await asyncio.gather(*(_open_one() for _ in range(size)), return_exceptions=True)
+        failed = sum(isinstance(result, BaseException) for result in results)
+
+        if failed:
+            log.warning(f"Прогрев пула соединений: не удалось открыть {failed} из {size} соединений.")
+        else:
+            log.info(f"Пул соединений прогрет ({size} соединений).")
 
     async def connect(self, **kwargs: Any) -> None:
         """
-        Устанавливает подключение к БД.
+        Инициализирует движок и фабрику сессий БД, а также отдельный движок для проверки доступности БД.
         Использует `DB_URL` из настроек.
 
+        Соединения открываются лениво, проверка доступности БД выполняется отдельно (`verify`).
+
         Args:
             **kwargs: Дополнительные параметры для create_async_engine.
-
-        Raises:
-            RuntimeError: При неудачной проверке подключения.
         """
 
+        # Параметры подключения psycopg (общие для основного движка и движка проверки доступности БД)
+        connect_args = {
+            # JIT-компиляция не окупается на коротких точечных запросах и только добавляет задержку
+            "options": "-c jit=off",
+            # Часто повторяющиеся запросы готовятся на сервере (prepared statements): без повторного разбора и плана
+            "prepare_threshold": settings.DB_PREPARE_THRESHOLD,
+            # TCP keepalive: "мертвые" соединения обнаруживает ядро ОС, а не запрос перед каждым использованием
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
+        }
+
         self.engine = create_async_engine(
-            url=str(settings.DB_URL),
+            url=settings.DB_URL,
             echo=settings.DEBUG,  # Включаем логирование SQL запросов в DEBUG-режиме
-            pool_pre_ping=True,  # Проверять соединение перед использованием
-            pool_recycle=3600,  # Переподключение каждый час
+            pool_size=settings.DB_POOL_SIZE,  # Количество постоянных соединений в пуле
+            max_overflow=settings.DB_MAX_OVERFLOW,  # Дополнительные соединения при пиковой нагрузке
+            pool_timeout=settings.DB_POOL_TIMEOUT,  # Ожидание свободного соединения (в секундах)
+            pool_pre_ping=settings.DB_POOL_PRE_PING,  # По умолчанию без лишнего запроса при получении соединения
+            pool_recycle=settings.DB_POOL_RECYCLE,  # Периодическое переподключение (в секундах)
+            connect_args=connect_args,
             **kwargs,
         )
 
+        # Одно постоянное соединение для фоновой проверки доступности БД (`verify`)
+        self.health_engine = create_async_engine(
+            url=settings.DB_URL,
+            pool_size=1,
+            max_overflow=0,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            connect_args=connect_args,
+        )
+
         self.session_factory = async_sessionmaker(
             bind=self.engine,
             class_=AsyncSession,
             expire_on_commit=False,  # Отключаем "протухание", чтобы атрибуты объектов были доступны после коммита
-            autocommit=False,  # Управляем транзакциями явно
             autoflush=False,  # Управляем flush явно
         )
 
-        # Проверяем работоспособность подключения к БД
-        await self._verify_connection()
-        log.success("Подключение к БД установлено.")
+        log.info("Движок БД инициализирован.")
 
     async def disconnect(self) -> None:
         """Корректное закрытие подключения к БД."""
@@ -92,6 +165,12 @@ class Database:
             await self.engine.dispose()
             self.engine = None
             self.session_factory = None
+
+            if self.health_engine:
+                await self.health_engine.dispose()
+                self.health_engine = None
+
+            self.ready = None
             log.info("Подключение к БД успешно закрыто.")
 
     @asynccontextmanager
@@ -99,6 +178,9 @@ class Database:
         """
         Асинхронный контекстный менеджер для работы с сессиями БД.
 
+        Фиксация транзакций остается за сервисами (Unit of Work),
+        незафиксированные изменения откатываются при закрытии сессии.
+
         Yields:
             AsyncSession: Экземпляр сессии БД.
 
@@ -109,16 +191,10 @@ class Database:
         if not self.session_factory:
             raise RuntimeError("БД не инициализирована. Вызовите `await db.connect()` перед использованием сессий.")
 
-        session: AsyncSession = self.session_factory()
-
-        try:
+        # Контекстный менеджер сессии сам закрывает ее на выходе,
+        # а закрытие откатывает незафиксированную транзакцию (в том числе при исключении)
+        async with self.session_factory() as session:
             yield session
-        except Exception:
-            log.error("Ошибка во время сессии БД, выполняется откат.", exc_info=True)
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
 
 
 # Глобальный экземпляр менеджера БД
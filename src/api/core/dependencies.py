@@ -7,8 +7,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.models import UrlLink
 from src.api.repositories import UrlLinkRepository
-from src.api.services import UrlLinkService
+from src.api.services import ClickCounter, UrlLinkService
+from src.api.utils import UrlCache
 
+from .config import settings
 from .database import get_db_session
 
 # --- Типизация для инъекции сессии базы данных ---
@@ -18,10 +20,17 @@ DBSession = Annotated[AsyncSession, Depends(get_db_session)]
 
 # --- Фабрики Репозиториев ---
 
+# Фабрики объявлены асинхронными: синхронные зависимости FastAPI выполняет в пуле потоков,
+# а здесь нет блокирующих операций, ради которых стоило бы занимать поток
 
-def get_urllink_repository() -> UrlLinkRepository:
-    """Создает экземпляр репозитория для работы с моделями UrlLink."""
-    return UrlLinkRepository(UrlLink)
+
+# Репозиторий не хранит состояния запроса (сессия передается в методы), поэтому создаем его один раз
+_urllink_repository = UrlLinkRepository(UrlLink)
+
+
+async def get_urllink_repository() -> UrlLinkRepository:
+    """Возвращает общий экземпляр репозитория для работы с моделями UrlLink."""
+    return _urllink_repository
 
 
 # Типизация репозиториев (для использования в аргументах функций)
@@ -31,9 +40,16 @@ UrlLinkRepo = Annotated[UrlLinkRepository, Depends(get_urllink_repository)]
 # --- Фабрики Сервисов ---
 
 
-def get_urllink_service(repository: UrlLinkRepo) -> UrlLinkService:
+# Кэш `short_code -> original_url` общий для всех запросов процесса
+_url_cache = UrlCache(max_size=settings.URL_CACHE_SIZE)
+
+# Буфер счетчиков переходов общий для всех запросов процесса (запись в БД запускается в lifespan)
+click_counter = ClickCounter(repository=_urllink_repository, max_pending=settings.CLICK_FLUSH_MAX_PENDING)
+
+
+async def get_urllink_service(repository: UrlLinkRepo) -> UrlLinkService:
     """Создает экземпляр сервиса для работы с UrlLink."""
-    return UrlLinkService(urllink_repository=repository)
+    return UrlLinkService(urllink_repository=repository, url_cache=_url_cache, click_counter=click_counter)
 
 
 # Типизация для сервисов (для использования в аргументах функций)
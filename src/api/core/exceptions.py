@@ -6,12 +6,19 @@
 чтобы возвращать стандартизированные JSON-ответы клиенту.
 """
 
-from fastapi import FastAPI, HTTPException, Request, status
+from typing import Any, ClassVar
+
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .logging import api_log as log
 
+# Типы ошибок, которые обработчики подставляют сами (общие константы вместо литералов в каждом обработчике)
+HTTP_ERROR_TYPE = "http_error"
+UNKNOWN_APP_ERROR_TYPE = "unknown_app_error"
+UNHANDLED_SERVER_ERROR_TYPE = "unhandled_server_error"
+
 # Словарь для маппинга статус-кодов в семантически верные типы ошибок
 STATUS_CODE_TO_ERROR_TYPE = {
     status.HTTP_400_BAD_REQUEST: "bad_request",
@@ -21,6 +28,9 @@ STATUS_CODE_TO_ERROR_TYPE = {
     status.HTTP_422_UNPROCESSABLE_ENTITY: "validation_error",
 }
 
+# Таблица типов ошибок, индексируемая напрямую статус-кодом (без хэширования на каждый ответ)
+_ERROR_TYPE_TABLE: tuple[str, ...] = tuple(STATUS_CODE_TO_ERROR_TYPE.get(code, HTTP_ERROR_TYPE) for code in range(600))
+
 
 # --- Структура ответа об ошибке ---
 class ErrorDetail(BaseModel):
@@ -34,6 +44,8 @@ class ErrorDetail(BaseModel):
              (например, ['body', 'field_name'] для ошибки валидации поля).
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: str = Field(..., description="Тип или код ошибки")
     msg: str = Field(..., description="Человекочитаемое сообщение об ошибке")
     loc: list[str] | None = Field(default=None, description="Локализация ошибки (например, поля в запросе)")
@@ -46,6 +58,8 @@ class ErrorResponse(BaseModel):
     Содержит одно поле 'detail', которое является объектом ErrorDetail.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     detail: ErrorDetail
 
 
@@ -57,11 +71,16 @@ class AppExceptionBase(HTTPException):
     Позволяет задать статус-код и детали ошибки по умолчанию.
     Автоматически формирует `detail` в виде словаря, соответствующего ErrorDetail.
 
+    Для деталей по умолчанию тело ответа сериализуется один раз при объявлении класса
+    и переиспользуется обработчиком без повторной сборки Pydantic моделей.
+
     Attributes:
         status_code (int): HTTP статус-код для этого типа исключения.
         error_type (str): Строковый идентификатор типа ошибки.
         message (str): Сообщение об ошибке по умолчанию.
         loc (list[str] | None): Опциональная локализация ошибки.
+        default_detail (dict[str, Any]): Детали ошибки по умолчанию (вычисляются для каждого класса).
+        default_body (bytes): Сериализованное тело ответа по умолчанию (вычисляется для каждого класса).
     """
 
     status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -69,6 +88,20 @@ class AppExceptionBase(HTTPException):
     message: str = "Произошла внутренняя ошибка сервера."
     loc: list[str] | None = None
 
+    default_detail: ClassVar[dict[str, Any]]
+    default_body: ClassVar[bytes]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Предварительно вычисляет детали и тело ответа по умолчанию для каждого подкласса."""
+        super().__init_subclass__(**kwargs)
+        cls._prepare_default_response()
+
+    @classmethod
+    def _prepare_default_response(cls) -> None:
+        """Собирает детали ошибки по умолчанию и сериализует их в JSON один раз."""
+        cls.default_detail = ErrorDetail(type=cls.error_type, msg=cls.message, loc=cls.loc).model_dump()
+        cls.default_body = bytes(JSONResponse(content={"detail": cls.default_detail}).body)
+
     def __init__(
         self,
         message: str | None = None,
@@ -88,16 +121,27 @@ class AppExceptionBase(HTTPException):
             headers (dict[str, str] | None): Дополнительные HTTP заголовки для ответа.
         """
         final_status_code = status_code if status_code is not None else self.status_code
-        final_error_type = error_type if error_type is not None else self.error_type
-        final_message = message if message is not None else self.message
-        final_loc = loc if loc is not None else self.loc
 
-        # Формируем detail как словарь, соответствующий ErrorDetail
-        detail_content_dict = ErrorDetail(type=final_error_type, msg=final_message, loc=final_loc).model_dump()
+        # Флаг использования деталей по умолчанию (тогда тело ответа уже сериализовано)
+        self.uses_default_detail = message is None and error_type is None and loc is None
+
+        if self.uses_default_detail:
+            detail_content_dict = dict(self.default_detail)
+        else:
+            final_error_type = error_type if error_type is not None else self.error_type
+            final_message = message if message is not None else self.message
+            final_loc = loc if loc is not None else self.loc
+
+            # Формируем detail как словарь, соответствующий ErrorDetail
+            detail_content_dict = ErrorDetail(type=final_error_type, msg=final_message, loc=final_loc).model_dump()
 
         super().__init__(status_code=final_status_code, detail=detail_content_dict, headers=headers)
 
 
+# Тело ответа по умолчанию для самого базового класса (`__init_subclass__` вызывается только для наследников)
+AppExceptionBase._prepare_default_response()
+
+
 # --- Конкретные кастомные исключения ---
 
 
@@ -177,26 +221,39 @@ class ConflictException(AppExceptionBase):
 # --- Обработчики исключений для FastAPI ---
 
 
-async def app_exception_handler(request: Request, exc: AppExceptionBase) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppExceptionBase) -> Response:
     """
     Обработчик для кастомных исключений, унаследованных от AppExceptionBase.
 
     Логирует ошибку и возвращает JSONResponse с деталями ошибки в стандартном формате.
     Детали ошибки берутся напрямую из атрибута `detail` исключения,
     который уже имеет нужную структуру словаря.
+    Если исключение использует детали по умолчанию, отдается заранее сериализованное тело ответа.
 
     Args:
         request (Request): Объект запроса FastAPI.
         exc (AppExceptionBase): Экземпляр кастомного исключения.
 
     Returns:
-        JSONResponse: Ответ с соответствующим статус-кодом и телом ошибки.
+        Response: Ответ с соответствующим статус-кодом и телом ошибки.
     """
-    detail_dict = exc.detail if isinstance(exc.detail, dict) else {"type": "unknown_app_error", "msg": str(exc.detail)}
+    detail_dict = (
+        exc.detail if isinstance(exc.detail, dict) else {"type": UNKNOWN_APP_ERROR_TYPE, "msg": str(exc.detail)}
+    )
 
     log.warning(
         f"AppException: {exc.status_code} {detail_dict.get('type', 'N/A')}: {detail_dict.get('msg', 'N/A')}. Path: {request.url.path}"
     )
+
+    # Детали по умолчанию: отдаем заранее сериализованное тело без повторной сериализации
+    if exc.uses_default_detail:
+        return Response(
+            content=exc.default_body,
+            status_code=exc.status_code,
+            headers=getattr(exc, "headers", None),
+            media_type="application/json",
+        )
+
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": detail_dict},
@@ -220,8 +277,8 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     """
     log.warning(f"HTTPException: {exc.status_code} Detail: '{exc.detail}'. Path: {request.url.path}")
 
-    # Получаем тип ошибки из маппинга, с дефолтным значением "http_error"
-    error_type = STATUS_CODE_TO_ERROR_TYPE.get(exc.status_code, "http_error")
+    # Получаем тип ошибки из таблицы, с дефолтным значением "http_error"
+    error_type = _ERROR_TYPE_TABLE[exc.status_code] if exc.status_code < len(_ERROR_TYPE_TABLE) else HTTP_ERROR_TYPE
     error_msg = str(exc.detail)
     error_loc: list[str] | None = None  # По умолчанию loc нет для обычных HTTPException
 
@@ -252,32 +309,40 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+# Детали непредвиденной ошибки не зависят от исключения, поэтому создаются один раз
+_UNHANDLED_ERROR_DETAIL = ErrorDetail(
+    type=UNHANDLED_SERVER_ERROR_TYPE,
+    msg="На сервере произошла непредвиденная ошибка. Пожалуйста, попробуйте позже.",
+    loc=None,
+)
+
+# Тело ответа для непредвиденных ошибок сериализуется один раз
+_UNHANDLED_ERROR_BODY: bytes = bytes(
+    JSONResponse(content=ErrorResponse(detail=_UNHANDLED_ERROR_DETAIL).model_dump()).body
+)
+
+
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Обработчик для всех остальных (непредвиденных) исключений.
 
     Логирует ошибку с полным трейсбэком и возвращает стандартизированный
-    ответ 500 Internal Server Error.
+    ответ 500 Internal Server Error (с заранее сериализованным телом).
 
     Args:
         request (Request): Объект запроса FastAPI.
         exc (Exception): Экземпляр непредвиденного исключения.
 
     Returns:
-        JSONResponse: Ответ 500 Internal Server Error в стандартном формате.
+        Response: Ответ 500 Internal Server Error в стандартном формате.
     """
-    log.exception(
-        f"Unhandled Exception: {exc}. Path: {request.url.path}",
-        exc_info=True,  # Всегда логируем полный трейсбек для непредвиденных ошибок
-    )
-    error_detail = ErrorDetail(
-        type="unhandled_server_error",
-        msg="На сервере произошла непредвиденная ошибка. Пожалуйста, попробуйте позже.",
-        loc=None,
-    )
-    return JSONResponse(
+    # Всегда логируем полный трейсбек для непредвиденных ошибок
+    log.opt(exception=exc).error(f"Unhandled Exception: {exc}. Path: {request.url.path}")
+
+    return Response(
+        content=_UNHANDLED_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=ErrorResponse(detail=error_detail).model_dump(),
+        media_type="application/json",
     )
 
 
@@ -7,42 +7,110 @@
 - Предоставление эндпоинта для проверки работоспособности (health check).
 """
 
-from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator
+import asyncio
+import time
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from typing import AsyncGenerator
 
-from fastapi import FastAPI, Response, status
-from sqlalchemy import text
+from anyio import to_thread
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse
 
 from src.api.core.config import settings
 from src.api.core.database import db
-from src.api.core.dependencies import DBSession
+from src.api.core.dependencies import click_counter
 from src.api.core.exceptions import setup_exception_handlers
 from src.api.core.logging import api_log as log
 from src.api.routes import api_router
 
 
+@dataclass
+class _HealthState:
+    """
+    Результат последней фоновой проверки доступности БД.
+
+    Attributes:
+        ok: Доступна ли БД по результатам последней проверки.
+        checked_at: Время последней проверки (по `time.monotonic()`).
+    """
+
+    ok: bool = False
+    checked_at: float = 0.0
+
+
+# Состояние здоровья сервиса, которое читает health check (без обращения к БД на каждый запрос)
+_health_state = _HealthState()
+
+
+async def _health_poller() -> None:
+    """
+    Фоновая задача: периодически проверяет доступность БД и обновляет `_health_state`.
+
+    После первой успешной проверки прогревает пул соединений. Прогрев ограничен по времени
+    интервалом проверки, чтобы медленная БД не задерживала следующие проверки.
+    """
+
+    pool_warmed = False
+
+    while True:
+        _health_state.ok = await db.verify()
+        _health_state.checked_at = time.monotonic()
+
+        if _health_state.ok and not pool_warmed:
+            pool_warmed = True
+            try:
+                await asyncio.wait_for(db.warm_up(settings.DB_POOL_SIZE), timeout=settings.HEALTH_TTL)
+            except TimeoutError:
+                log.warning(f"Прогрев пула соединений не завершился за {settings.HEALTH_TTL} с и прерван.")
+
+        await asyncio.sleep(settings.HEALTH_TTL)
+
+
 # Определяем lifespan для управления подключением к БД
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Контекстный менеджер для управления жизненным циклом приложения.
     Выполняет подключение к БД при старте приложения и корректное отключение при его остановке.
+    Проверка доступности БД выполняется в фоне (периодически) и не блокирует старт приложения.
 
     Args:
         app (FastAPI): Экземпляр приложения FastAPI.
     """
     log.info("Инициализация приложения...")
 
+    health_task: asyncio.Task[None] | None = None
+    click_flush_task: asyncio.Task[None] | None = None
+
+    # Расширяем пул потоков AnyIO (по умолчанию 40) для синхронного кода, вызываемого из обработчиков
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREAD_POOL_SIZE
+
     try:
         await db.connect()
+        # Периодически проверяем доступность БД в фоне (результат читает health check) и прогреваем пул
+        health_task = asyncio.create_task(_health_poller())
+        # Пакетно записываем накопленные счетчики переходов в БД
+        click_flush_task = asyncio.create_task(click_counter.run(settings.CLICK_FLUSH_INTERVAL))
         yield
     except Exception as exc:
         # Логируем критическую ошибку, если подключение к БД не удалось при старте
-        log.critical(f"Критическая ошибка при старте приложения: {exc}", exc_info=True)
+        log.opt(exception=exc).critical(f"Критическая ошибка при старте приложения: {exc}")
         # Повторно вызываем исключение, чтобы приложение не запустилось в нерабочем состоянии
         raise exc
     finally:
         log.info("Остановка приложения...")
+
+        for task in (health_task, click_flush_task):
+            if task and not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
+        # Записываем оставшиеся переходы до закрытия подключения
+        if db.engine:
+            await click_counter.flush()
+
         await db.disconnect()
         log.info("Приложение остановлено.")
 
@@ -87,31 +155,25 @@ app = create_app()
     tags=["Health Check"],
     summary="Проверка работоспособности сервиса и его зависимостей",
     description=(
-        "Проверяет, что API запущен и имеет доступ к БД. В случае недоступности БД возвращает HTTP статус 503."
+        "Проверяет, что API запущен и имеет доступ к БД (по результату периодической фоновой проверки). "
+        "В случае недоступности БД возвращает HTTP статус 503."
     ),
 )
-async def health_check(
-    response: Response,
-    db_session: DBSession,
-) -> dict[str, Any]:
+async def health_check() -> JSONResponse:
     """
     Эндпоинт для проверки работоспособности сервиса.
 
-    Args:
-        response (Response): Объект ответа FastAPI для управления статус-кодом.
-        db_session (DBSession): Зависимость, предоставляющая сессию БД.
+    Не обращается к БД: читает результат последней фоновой проверки.
+    БД считается недоступной, если проверка провалилась или ее результат устарел (старше двух интервалов).
 
     Returns:
-        dict: Словарь со статусом API и его зависимостей.
+        JSONResponse: Ответ со статусом API и его зависимостей
+                      (возвращается напрямую, без дополнительной сериализации FastAPI).
     """
 
-    try:
-        # Выполняем простой и быстрый запрос к БД для проверки соединения
-        await db_session.execute(text("SELECT 1"))
-        is_db_ok = True
-    except Exception:
-        # Ошибка означает, что подключение к БД потеряно или неисправно
-        is_db_ok = False
+    # Результат фоновой проверки считается актуальным в течение двух интервалов проверки
+    is_fresh = time.monotonic() - _health_state.checked_at <= 2 * settings.HEALTH_TTL
+    is_db_ok = _health_state.ok and is_fresh
 
     # Формируем тело ответа
     response_body = {
@@ -121,7 +183,7 @@ async def health_check(
 
     # Если БД недоступна, меняем HTTP статус ответа на 503 Service Unavailable
     if not is_db_ok:
-        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
         log.warning("Health check провален: нет подключения к БД.")
+        return JSONResponse(content=response_body, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
 
-    return response_body
+    return JSONResponse(content=response_body)
@@ -75,7 +75,8 @@ class Base(DeclarativeBase, TimestampMixin):
 
     # Общий первичный ключ для большинства моделей
     # Если у какой-то модели будет другой ПК, его нужно будет объявить там явно
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
+    # Отдельный индекс не нужен: первичный ключ уже индексируется
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
 
     def __repr__(self) -> str:
         """
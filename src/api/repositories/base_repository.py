@@ -25,6 +25,8 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         model: Класс модели SQLAlchemy, с которым работает репозиторий.
     """
 
+    __slots__ = ("model",)
+
     def __init__(self, model: type[ModelType]):
         """
         Инициализирует базовый репозиторий.
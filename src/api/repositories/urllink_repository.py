@@ -1,13 +1,32 @@
 """Репозиторий для работы с моделью UrlLink."""
 
+from typing import cast
+
 from pydantic import BaseModel
-from sqlalchemy import ColumnElement, select, update
+from sqlalchemy import Table, bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.models import UrlLink
 
 from .base_repository import BaseRepository
 
+# Запросы горячих путей собираются один раз при импорте; значения передаются через именованные параметры
+_url_table = cast(Table, UrlLink.__table__)
+
+_GET_BY_CODE_STMT = select(UrlLink).where(UrlLink.short_code == bindparam("b_short_code"))
+
+_GET_ORIGINAL_URL_STMT = select(UrlLink.original_url).where(UrlLink.short_code == bindparam("b_short_code"))
+
+_GET_BY_ORIGINAL_URL_STMT = select(UrlLink).where(UrlLink.original_url == bindparam("b_original_url")).limit(1)
+
+# Работаем с таблицей напрямую (Core), чтобы выполнить один UPDATE для всех наборов параметров (executemany)
+_ADD_CLICK_COUNTS_STMT = (
+    update(_url_table)
+    .where(_url_table.c.short_code == bindparam("b_short_code"))
+    .values(click_count=_url_table.c.click_count + bindparam("b_clicks"))
+)
+
 
 class UrlLinkRepository(BaseRepository[UrlLink, BaseModel, BaseModel]):  # Используем BaseModel как тип-заглушку
     """
@@ -16,69 +35,94 @@ class UrlLinkRepository(BaseRepository[UrlLink, BaseModel, BaseModel]):  # Ис
     Наследует общие методы от BaseRepository и содержит специфичные для UrlLink методы.
     """
 
-    async def create(self, db_session: AsyncSession, *, new_link_data: dict[str, str]) -> UrlLink:
+    __slots__ = ()
+
+    async def insert_if_absent(self, db_session: AsyncSession, *, new_link_data: dict[str, str]) -> UrlLink | None:
         """
-        Создает и добавляет новый объект ссылки в сессию.
+        Создает новый объект ссылки, если шорт код еще не занят.
+
+        Проверка и вставка выполняются атомарно одним запросом
+        `INSERT ... ON CONFLICT (short_code) DO NOTHING RETURNING`.
 
         Args:
             db_session (AsyncSession): Асинхронная сессия базы данных.
             new_link_data (dict[str, str]): Словарь с данными для создания нового объекта ссылки.
 
         Returns:
-            UrlLink: Созданный экземпляр ссылки.
+            UrlLink | None: Созданный экземпляр ссылки или None, если шорт код уже занят.
         """
-        # Подготавливаем объект
-        new_link = self.model(**new_link_data)
+        # Вставляем запись и сразу получаем сгенерированные БД значения (id, created_at, ...) одним запросом
+        statement = (
+            insert(self.model)
+            .values(**new_link_data)
+            .on_conflict_do_nothing(index_elements=[self.model.short_code])
+            .returning(self.model)
+        )
 
-        # Добавляем объект в сессию
-        db_session.add(new_link)
+        result = await db_session.execute(statement)
 
-        # Получаем ID и другие сгенерированные базой данных значения
-        await db_session.flush()
+        # При конфликте шорт кода запрос не возвращает строк
+        return result.scalar_one_or_none()
 
-        # Обновляем объект из базы данных
-        await db_session.refresh(new_link)
+    async def get_by_code(self, db_session: AsyncSession, short_code: str) -> UrlLink | None:
+        """
+        Получает объект ссылки по шорт коду.
 
-        # Возвращаем созданный объект
-        return new_link
+        Args:
+            db_session (AsyncSession): Асинхронная сессия базы данных.
+            short_code (str): Шорт код (случайно сгенерированная строка).
 
-    async def get_by_filter(self, db_session: AsyncSession, *filters: ColumnElement[bool]) -> UrlLink | None:
+        Returns:
+            UrlLink | None: Экземпляр модели или None, если запись не найдена.
         """
-        Получает первую запись, соответствующую заданным критериям фильтрации, или None.
+        result = await db_session.execute(_GET_BY_CODE_STMT, {"b_short_code": short_code})
 
-        Критерии должны быть выражениями SQLAlchemy (например, self.model.name == "John").
+        return result.scalar_one_or_none()
+
+    async def get_by_original_url(self, db_session: AsyncSession, original_url: str) -> UrlLink | None:
+        """
+        Получает объект ссылки по оригинальной пользовательской ссылке.
 
         Args:
             db_session (AsyncSession): Асинхронная сессия базы данных.
-            *filters (ColumnElement[bool]): Один или несколько критериев фильтрации SQLAlchemy.
-                                            Они будут объединены через AND.
+            original_url (str): Оригинальная пользовательская ссылка.
 
         Returns:
             UrlLink | None: Экземпляр модели или None, если запись не найдена.
         """
-        statement = select(self.model)
+        result = await db_session.execute(_GET_BY_ORIGINAL_URL_STMT, {"b_original_url": original_url})
 
-        if filters:
-            statement = statement.where(*filters)
+        return result.scalar_one_or_none()
 
-        # Явное ограничение остановки поиска после первого совпадения
-        statement = statement.limit(1)
+    async def get_original_url(self, db_session: AsyncSession, short_code: str) -> str | None:
+        """
+        Получает только оригинальную ссылку по шорт коду (без загрузки всего объекта).
 
-        result = await db_session.execute(statement)
+        Args:
+            db_session (AsyncSession): Асинхронная сессия базы данных.
+            short_code (str): Шорт код (случайно сгенерированная строка).
+
+        Returns:
+            str | None: Оригинальная ссылка или None, если объект ссылки не найден.
+        """
+        result = await db_session.execute(_GET_ORIGINAL_URL_STMT, {"b_short_code": short_code})
 
         return result.scalar_one_or_none()
 
-    async def increment_click_count(self, db_session: AsyncSession, short_code: str) -> None:
+    async def add_click_counts(self, db_session: AsyncSession, click_counts: dict[str, int]) -> None:
         """
-        Метод инкремент.
-        Увеличивает `click_count` (счетчик переходов по ссылке) у объекта ссылки на 1.
+        Пакетно увеличивает `click_count` (счетчик переходов по ссылке) у нескольких объектов ссылок.
+
+        Выполняется одним `UPDATE` в режиме executemany (по набору параметров на каждый шорт код).
 
         Args:
             db_session (AsyncSession): Асинхронная сессия базы данных.
-            short_code (str): Шорт код (случайно сгенерированная строка).
+            click_counts (dict[str, int]): Словарь `short_code -> количество новых переходов`.
         """
-        statement = (
-            update(self.model).where(self.model.short_code == short_code).values(click_count=self.model.click_count + 1)
-        )
+        if not click_counts:
+            return
 
-        await db_session.execute(statement)
+        await db_session.execute(
+            _ADD_CLICK_COUNTS_STMT,
+            [{"b_short_code": short_code, "b_clicks": clicks} for short_code, clicks in click_counts.items()],
+        )
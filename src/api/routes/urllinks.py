@@ -1,7 +1,6 @@
 """Эндпоинты для управления ссылками (UrlLinks)."""
 
-from fastapi import APIRouter, BackgroundTasks, status
-from starlette.responses import RedirectResponse
+from fastapi import APIRouter, Request, Response, status
 
 from src.api.core.dependencies import DBSession, UrlLinkSvc
 from src.api.schemas import UrlLinkCreateSchema, UrlLinkDetailsResponseSchema, UrlLinkResponseSchema
@@ -9,6 +8,9 @@ from src.api.utils import format_short_url
 
 router = APIRouter(prefix="/urls", tags=["URLs"])
 
+# Политика кэширования детальной информации (счетчик переходов меняется, но точность до секунд не нужна)
+DETAILS_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=60"
+
 
 @router.post(
     "/shorten",
@@ -39,7 +41,8 @@ async def create_link(
     # Создаем новый объект ссылки
     new_link = await urllink_service.create(db_session, url=data_in.url)
 
-    return UrlLinkResponseSchema(
+    # Данные получены из БД и уже проверены, поэтому собираем схему без повторной валидации
+    return UrlLinkResponseSchema.model_construct(
         short_code=new_link.short_code,
         original_url=new_link.original_url,
         short_url=format_short_url(new_link.short_code),
@@ -56,53 +59,65 @@ async def get_link(
     short_code: str,
     db_session: DBSession,
     urllink_service: UrlLinkSvc,
-    background_tasks: BackgroundTasks,
-) -> RedirectResponse:
+) -> Response:
     """
     Находит объект ссылки по шорт коду и перенаправляет на оригинальный URL.
 
+    Оригинальная ссылка берется из кэша (при промахе - одним запросом к БД), а переход учитывается
+    в буфере счетчиков в памяти и записывается в БД пакетно в фоне.
+
     Args:
         short_code: Шорт код ссылки из URL пути.
         db_session: Асинхронная сессия базы данных.
         urllink_service: Сервис для работы со ссылками.
 
     Returns:
-        RedirectResponse: Ответ перенаправления на оригинальный URL.
+        Response: Ответ перенаправления (307) на оригинальный URL без тела.
 
     Raises:
         NotFoundException: Если ссылка не найдена.
     """
 
-    # Проверка существования объекта ссылки
-    link = await urllink_service.get_by_code(db_session, short_code=short_code)
-
-    # Фоном увеличиваем счетчик переходов по ссылке через BackgroundTasks
-    background_tasks.add_task(urllink_service.perform_click_increment, short_code)
+    # Получаем оригинальную ссылку (из кэша или БД) и учитываем переход в буфере счетчиков
+    original_url = await urllink_service.get_original_url_for_redirect(db_session, short_code=short_code)
 
-    return RedirectResponse(link.original_url)
+    # Минимальный ответ перенаправления: только статус и заголовки (`RedirectResponse` делает то же, но дороже)
+    return Response(
+        status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+        headers={"location": original_url, "cache-control": "no-store"},
+    )
 
 
 @router.get(
     "/{short_code}/details",
+    response_model=UrlLinkDetailsResponseSchema,
     status_code=status.HTTP_200_OK,
     summary="Вывод детальной информации по шорт коду",
     description="Находит объект ссылки по шорт коду и выводит детальную информацию",
 )
 async def get_link_details(
     short_code: str,
+    request: Request,
+    response: Response,
     db_session: DBSession,
     urllink_service: UrlLinkSvc,
-) -> UrlLinkDetailsResponseSchema:
+) -> UrlLinkDetailsResponseSchema | Response:
     """
     Находит объект ссылки по шорт коду и выводит детальную информацию.
 
+    Ответ снабжается заголовками `ETag` и `Cache-Control`. Если клиент уже имеет актуальную версию
+    (`If-None-Match` совпадает с `ETag`), возвращается 304 без тела.
+
     Args:
         short_code: Шорт код ссылки из URL пути.
+        request: Входящий запрос (для чтения заголовка `If-None-Match`).
+        response: Объект ответа FastAPI для установки заголовков кэширования.
         db_session: Асинхронная сессия базы данных.
         urllink_service: Сервис для работы со ссылками.
 
     Returns:
-        UrlLinkDetailsResponseSchema: Детальная информация об объекте ссылки.
+        UrlLinkDetailsResponseSchema | Response: Детальная информация об объекте ссылки
+                                                 или пустой ответ 304 Not Modified.
 
     Raises:
         NotFoundException: Если ссылка не найдена.
@@ -111,7 +126,18 @@ async def get_link_details(
     # Проверка существования объекта ссылки
     link = await urllink_service.get_by_code(db_session, short_code=short_code)
 
-    return UrlLinkDetailsResponseSchema(
+    # Версия ответа меняется только вместе со счетчиком переходов
+    etag = f'W/"{link.short_code}-{link.click_count}"'
+    cache_headers = {"etag": etag, "cache-control": DETAILS_CACHE_CONTROL}
+
+    # Клиент уже имеет актуальную версию ответа
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    response.headers.update(cache_headers)
+
+    # Данные получены из БД и уже проверены, поэтому собираем схему без повторной валидации
+    return UrlLinkDetailsResponseSchema.model_construct(
         short_code=link.short_code,
         original_url=link.original_url,
         short_url=format_short_url(link.short_code),
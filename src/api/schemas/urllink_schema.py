@@ -1,9 +1,12 @@
 """Схемы Pydantic для модели UrlLink"""
 
-from pydantic import Field, HttpUrl
+from pydantic import ConfigDict, Field, HttpUrl, TypeAdapter, field_validator
 
 from .base_schema import BaseSchema
 
+# Валидатор URL создается один раз (валидация выполняется в Rust-ядре Pydantic)
+_http_url_adapter: TypeAdapter[HttpUrl] = TypeAdapter(HttpUrl)
+
 
 class UrlLinkBaseSchema(BaseSchema):
     """Базовая схема ссылки."""
@@ -13,9 +16,27 @@ class UrlLinkBaseSchema(BaseSchema):
 
 
 class UrlLinkCreateSchema(BaseSchema):
-    """Схема для создания новой ссылки (данные от пользователя)."""
+    """
+    Схема для создания новой ссылки (данные от пользователя).
+
+    Ссылка проверяется как `HttpUrl` один раз на входе и дальше передается нормализованной строкой.
+    """
 
-    url: HttpUrl = Field(..., description="Ссылка от пользователя")
+    url: str = Field(..., description="Ссылка от пользователя", json_schema_extra={"format": "uri"})
+
+    @field_validator("url")
+    @classmethod
+    def validate_url(cls, value: str) -> str:
+        """
+        Проверяет, что строка является корректной HTTP(S) ссылкой, и возвращает ее нормализованный вид.
+
+        Args:
+            value (str): Ссылка от пользователя.
+
+        Returns:
+            str: Нормализованная ссылка.
+        """
+        return str(_http_url_adapter.validate_python(value))
 
 
 class UrlLinkResponseSchema(UrlLinkBaseSchema):
@@ -23,8 +44,11 @@ class UrlLinkResponseSchema(UrlLinkBaseSchema):
     Схема ответа пользователю.
 
     Наследует поля от базовой схемы ссылки.
+    Поля содержат уже проверенные значения из БД, поэтому схема неизменяема и не принимает лишних полей.
     """
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     short_url: str = Field(..., description="Новая короткая ссылка")
 
 
@@ -1,7 +1,9 @@
 from .base_service import BaseService
+from .click_counter import ClickCounter
 from .urllink_service import UrlLinkService
 
 __all__ = [
     "BaseService",
+    "ClickCounter",
     "UrlLinkService",
 ]
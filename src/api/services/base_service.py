@@ -32,6 +32,8 @@ class BaseService(Generic[ModelType, RepositoryType, CreateSchemaType, UpdateSch
         repository (RepositoryType): Экземпляр репозитория для работы с данными.
     """
 
+    __slots__ = ("repository",)
+
     def __init__(self, repository: RepositoryType):
         """
         Инициализирует базовый сервис.
@@ -0,0 +1,113 @@
+"""Буфер счетчиков переходов по ссылкам с периодической пакетной записью в БД."""
+
+import asyncio
+from collections import Counter
+from contextlib import suppress
+
+from src.api.core.database import db
+from src.api.core.logging import api_log as log
+from src.api.repositories import UrlLinkRepository
+
+# Максимальная пауза между повторными попытками записи после ошибок (в секундах)
+_MAX_RETRY_DELAY = 30.0
+
+
+class ClickCounter:
+    """
+    Накапливает переходы по ссылкам в памяти и периодически записывает их в БД одним пакетом.
+
+    Вместо отдельного UPDATE и коммита на каждый редирект выполняется одна транзакция на интервал
+    (или раньше, если в буфере накопилось `max_pending` ссылок).
+    После ошибки записи повторные попытки выполняются с экспоненциально растущей паузой
+    (досрочная запись при заполнении буфера в это время не запускается).
+    Буфер используется в рамках одного event loop, поэтому не требует блокировок.
+
+    Attributes:
+        repository (UrlLinkRepository): Репозиторий для работы со ссылками.
+        max_pending (int): Количество ссылок в буфере, при котором запись выполняется досрочно.
+    """
+
+    __slots__ = ("repository", "max_pending", "_pending", "_flush_requested", "_failures")
+
+    def __init__(self, repository: UrlLinkRepository, max_pending: int):
+        """
+        Инициализирует пустой буфер.
+
+        Args:
+            repository (UrlLinkRepository): Репозиторий для работы со ссылками.
+            max_pending (int): Количество ссылок в буфере, при котором запись выполняется досрочно.
+        """
+        self.repository = repository
+        self.max_pending = max_pending
+        self._pending: Counter[str] = Counter()
+        # Сигнал фоновой задаче о досрочной записи
+        self._flush_requested = asyncio.Event()
+        # Количество подряд неудачных попыток записи (0 - последняя запись успешна)
+        self._failures = 0
+
+    def add(self, short_code: str) -> None:
+        """
+        Учитывает переход по ссылке (без обращения к БД).
+
+        Args:
+            short_code (str): Шорт код (случайно сгенерированная строка).
+        """
+        self._pending[short_code] += 1
+
+        # Пока ожидается повторная попытка после ошибки, досрочную запись не запускаем (БД, вероятно, недоступна)
+        if len(self._pending) >= self.max_pending and not self._failures:
+            self._flush_requested.set()
+
+    async def flush(self) -> None:
+        """
+        Записывает накопленные переходы в БД одной транзакцией.
+
+        При ошибке записи переходы возвращаются в буфер и будут записаны при следующей попытке.
+        Ошибка и восстановление записи логируются один раз (при смене состояния), а не на каждую попытку.
+        """
+        if not self._pending:
+            return
+
+        # Подменяем буфер до первого await, чтобы новые переходы копились уже в новом счетчике
+        pending, self._pending = self._pending, Counter()
+
+        async with db.session() as session:
+            try:
+                await self.repository.add_click_counts(session, pending)
+                await session.commit()
+            except asyncio.CancelledError:
+                # Задачу остановили во время записи (завершение приложения): возвращаем переходы для финальной записи
+                self._pending.update(pending)
+                raise
+            except Exception as exc:
+                # rollback и close произойдут автоматически в контекстном менеджере db.session()
+                self._pending.update(pending)
+                self._failures += 1
+                if self._failures == 1:
+                    log.error(f"Ошибка при обновлении счетчиков кликов (повтор с увеличивающейся паузой): {exc}")
+            else:
+                if self._failures:
+                    log.info(f"Запись счетчиков кликов восстановлена после {self._failures} неудачных попыток.")
+                    self._failures = 0
+                log.debug("Счетчики кликов обновлены для {} ссылок.", len(pending))
+
+    async def run(self, interval: float) -> None:
+        """
+        Фоновая задача: записывает накопленные переходы в БД раз в интервал или досрочно при заполнении буфера.
+
+        После ошибок записи пауза перед следующей попыткой удваивается (до `_MAX_RETRY_DELAY`).
+
+        Args:
+            interval (float): Максимальный интервал между записями (в секундах).
+        """
+        while True:
+            if self._failures:
+                # Повтор после ошибки: ждем паузу целиком, без досрочной записи
+                # (показатель степени ограничен, чтобы при долгом простое БД не переполнить float)
+                await asyncio.sleep(min(interval * 2 ** min(self._failures, 16), _MAX_RETRY_DELAY))
+            else:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._flush_requested.wait(), timeout=interval)
+
+            self._flush_requested.clear()
+            await self.flush()
@@ -1,16 +1,16 @@
 """Сервис для работы с UrlLink."""
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.core.database import db
 from src.api.core.exceptions import ConflictException, NotFoundException
 from src.api.core.logging import api_log as log
 from src.api.models import UrlLink
 from src.api.repositories import UrlLinkRepository
-from src.api.utils import generate_short_code
+from src.api.utils import UrlCache, generate_short_code
 
 from .base_service import BaseService
+from .click_counter import ClickCounter
 
 
 class UrlLinkService(
@@ -20,75 +20,80 @@ class UrlLinkService(
     Сервис для управления ссылками.
 
     Отвечает за создание, чтение, обновление и удаление записей о ссылках.
+
+    Attributes:
+        url_cache (UrlCache): Кэш `short_code -> original_url` для редиректов.
+        click_counter (ClickCounter): Буфер счетчиков переходов по ссылкам.
     """
 
-    def __init__(self, urllink_repository: UrlLinkRepository):
+    __slots__ = ("url_cache", "click_counter")
+
+    def __init__(self, urllink_repository: UrlLinkRepository, url_cache: UrlCache, click_counter: ClickCounter):
         """
         Инициализирует сервис для репозитория UrlLinkRepository.
 
         Args:
             urllink_repository (UrlLinkRepository): Репозиторий для работы со ссылками.
+            url_cache (UrlCache): Кэш `short_code -> original_url` для редиректов.
+            click_counter (ClickCounter): Буфер счетчиков переходов по ссылкам.
         """
         super().__init__(repository=urllink_repository)
+        self.url_cache = url_cache
+        self.click_counter = click_counter
 
-    async def create(self, db_session: AsyncSession, *, url: HttpUrl) -> UrlLink:
+    async def create(self, db_session: AsyncSession, *, url: str) -> UrlLink:
         """
         Создает новый объект ссылки.
 
-        Управляет транзакцией: выполняет commit в случае успеха или rollback при ошибке.
+        Управляет транзакцией (`db_session.begin()`): commit в случае успеха или rollback при ошибке.
 
         Args:
             db_session (AsyncSession): Асинхронная сессия базы данных.
-            url (HttpUrl): Оригинальная пользовательская ссылка, прошедшая валидацию.
+            url (str): Оригинальная пользовательская ссылка, прошедшая валидацию (нормализованная строка).
 
         Returns:
             UrlLink: Созданный объект ссылки.
 
         Raises:
-            ConflictException: Если ссылка с таким шорт кодом уже существует в БД.
+            ConflictException: Если не удалось подобрать свободный шорт код за отведенное число попыток.
         """
         # Лимит количества попыток для генерации шорт кода
         attempts: int = 5
 
-        for attempt in range(attempts):
-            # Генерируем шорт код
-            short_code: str = generate_short_code()
-
-            # Проверяем, существует ли такой шорт код в БД
-            existed_short_code = await self.repository.is_exists(
-                db_session,
-                self.repository.model.short_code == short_code,
-            )
-
-            # Если шорт код существует
-            if existed_short_code:
-                log.warning(f"Коллизия: {short_code} уже занят. Попытка {attempt + 1}/{attempts}")
-                continue  # Пробуем снова
+        new_link: UrlLink | None = None
 
-            # Конвертируем данные в словарь
-            new_link_data = {"original_url": str(url), "short_code": short_code}
-            log.debug(f"Подготовка к созданию объекта UrlLink из данных: {new_link_data}")
+        try:
+            # Транзакция фиксируется при выходе из блока и откатывается при исключении
+            async with db_session.begin():
+                for attempt in range(attempts):
+                    # Генерируем шорт код и конвертируем данные в словарь
+                    short_code: str = generate_short_code()
+                    new_link_data = {"original_url": url, "short_code": short_code}
+                    log.debug("Подготовка к созданию объекта UrlLink из данных: {}", new_link_data)
 
-            try:
-                # Репозиторий добавляет объект в сессию
-                new_link = await self.repository.create(db_session, new_link_data=new_link_data)
+                    # Репозиторий вставляет запись, если шорт код свободен (проверка и вставка атомарны)
+                    new_link = await self.repository.insert_if_absent(db_session, new_link_data=new_link_data)
 
-                # Сервис фиксирует транзакцию (бизнес-операция завершена успешно)
-                await db_session.commit()
+                    # Запись создана, бизнес-операция завершена успешно
+                    if new_link is not None:
+                        break
 
-                # Логируем успешное создание объекта
-                log.info(f"Объект UrlLink (ID: {new_link.id}) успешно создан.")
+                    # Шорт код уже занят, пробуем снова
+                    log.warning(f"Коллизия: {short_code} уже занят. Попытка {attempt + 1}/{attempts}")
 
-                # Возвращаем созданный объект
-                return new_link
+        except Exception as exc:
+            # Транзакция уже откачена, логируем ошибку и выбрасываем исключение
+            # (трейсбек залогирует общий обработчик исключений)
+            log.error(f"Ошибка при создании объекта UrlLink: {exc}")
+            raise exc
 
-            except Exception as exc:
-                # При любой ошибке откатываем транзакцию, чтобы сохранить целостность данных
-                await db_session.rollback()
+        if new_link is not None:
+            # Сразу кладем ссылку в кэш: первый редирект по новой ссылке обойдется без запроса к БД
+            self.url_cache.set(new_link.short_code, new_link.original_url)
 
-                # Логируем ошибку и выбрасываем исключение
-                log.error(f"Ошибка при создании объекта UrlLink: {exc}", exc_info=True)
-                raise exc
+            # Логируем успешное создание объекта и возвращаем его
+            log.info(f"Объект UrlLink (ID: {new_link.id}) успешно создан.")
+            return new_link
 
         # Если цикл завершился (мы исчерпали лимит попыток генерации шорт кода), выбрасываем исключение
         raise ConflictException(
@@ -110,22 +115,56 @@ class UrlLinkService(
             NotFoundException: Если ссылка не найдена.
         """
         # Проверка существования объекта ссылки
-        log.debug(f"Получение объекта ссылки по шорт коду: {short_code}")
-        url = await self.repository.get_by_filter(db_session, self.repository.model.short_code == short_code)
-
-        status = f"найден (ID: {url.id})" if url else "не найден"
-        message = f"Объект ссылки по шорт коду ({short_code}) {status}."
+        log.debug("Получение объекта ссылки по шорт коду: {}", short_code)
+        link = await self.repository.get_by_code(db_session, short_code)
 
         # Если объект ссылки не найден, выбрасываем исключение
-        if not url:
+        if not link:
             raise NotFoundException(
-                message=message,
+                message=f"Объект ссылки по шорт коду ({short_code}) не найден.",
                 error_type="urllink_not_found",
             )
 
         # Логируем успех и возвращаем найденный объект ссылки
-        log.debug(message)
-        return url
+        log.debug("Объект ссылки по шорт коду ({}) найден (ID: {}).", short_code, link.id)
+        return link
+
+    async def get_original_url_for_redirect(self, db_session: AsyncSession, *, short_code: str) -> str:
+        """
+        Получает оригинальную ссылку по шорт коду для редиректа и увеличивает счетчик переходов.
+
+        Оригинальная ссылка берется из кэша, если она там есть, иначе из БД (и сохраняется в кэш).
+        Переход учитывается в буфере счетчиков и записывается в БД пакетно в фоне.
+
+        Args:
+            db_session (AsyncSession): Асинхронная сессия базы данных.
+            short_code (str): Шорт код (случайно сгенерированная строка).
+
+        Returns:
+            str: Оригинальная пользовательская ссылка.
+
+        Raises:
+            NotFoundException: Если ссылка не найдена.
+        """
+        original_url = self.url_cache.get(short_code)
+
+        if not original_url:
+            original_url = await self.repository.get_original_url(db_session, short_code)
+
+            # Если объект ссылки не найден, выбрасываем исключение
+            if not original_url:
+                raise NotFoundException(
+                    message=f"Объект ссылки по шорт коду ({short_code}) не найден.",
+                    error_type="urllink_not_found",
+                )
+
+            self.url_cache.set(short_code, original_url)
+
+        # Учитываем переход (в БД счетчик попадет при очередной пакетной записи)
+        self.click_counter.add(short_code)
+
+        log.debug("Редирект по шорт коду ({}).", short_code)
+        return original_url
 
     async def get_by_original_url(self, db_session: AsyncSession, *, original_url: str) -> UrlLink:
         """
@@ -142,36 +181,16 @@ class UrlLinkService(
             NotFoundException: Если ссылка не найдена.
         """
         # Проверка существования объекта ссылки
-        log.debug(f"Получение объекта ссылки по оригинальной ссылке: {original_url}")
-        url = await self.repository.get_by_filter(db_session, self.repository.model.original_url == original_url)
-
-        status = f"найден (ID: {url.id})" if url else "не найден"
-        message = f"Объект ссылки по оригинальной ссылке ({url}) {status}."
+        log.debug("Получение объекта ссылки по оригинальной ссылке: {}", original_url)
+        link = await self.repository.get_by_original_url(db_session, original_url)
 
         # Если объект ссылки не найден, выбрасываем исключение
-        if not url:
+        if not link:
             raise NotFoundException(
-                message=message,
+                message=f"Объект ссылки по оригинальной ссылке ({original_url}) не найден.",
                 error_type="urllink_not_found",
             )
 
         # Логируем успех и возвращаем найденный объект ссылки
-        log.debug(message)
-        return url
-
-    async def perform_click_increment(self, short_code: str) -> None:
-        """
-        Фоновая задача: создает свою сессию и вызывает инкремент в репозитории.
-
-        Args:
-            short_code (str): Шорт код (случайно сгенерированная строка).
-        """
-        # Открываем абсолютно новую сессию, не связанную с HTTP запросом
-        async with db.session() as session:
-            try:
-                await self.repository.increment_click_count(session, short_code)
-                # Коммитим (бизнес-операция завершена успешно)
-                await session.commit()
-            except Exception as exc:
-                # rollback и close произойдут автоматически в контекстном менеджере db.session()
-                log.error(f"Ошибка при обновлении счетчика кликов: {exc}")
+        log.debug("Объект ссылки по оригинальной ссылке ({}) найден (ID: {}).", original_url, link.id)
+        return link
@@ -1,7 +1,9 @@
 from .short_code_generator import generate_short_code
 from .short_url_formatter import format_short_url
+from .url_cache import UrlCache
 
 __all__ = [
+    "UrlCache",
     "format_short_url",
     "generate_short_code",
 ]
@@ -1,14 +1,22 @@
 """Модуль для генерации шорт кодов (случайно сгенерированных строк)."""
 
-from secrets import choice
+from secrets import token_bytes
 
 CHARSET = "23456789abcdefghjkmnpqrstuvwxyzABCDEFGHJKMNPQRSTUVWXYZ"
 
+# Алфавит в байтах и маска младших 6 бит (64 значения покрывают все символы алфавита)
+_CHARSET_BYTES = CHARSET.encode("ascii")
+_CHARSET_SIZE = len(_CHARSET_BYTES)
+_MASK = 0x3F
+
 
 def generate_short_code(length: int = 6) -> str:
     """
     Генерирует шорт код (строку, состоящую из случайных букв и цифр).
 
+    Случайные байты берутся из CSPRNG одним вызовом, каждый байт отображается в символ алфавита
+    по младшим 6 битам. Значения за пределами алфавита отбрасываются, чтобы распределение осталось равномерным.
+
     Args:
         length (int): Длина генерируемой строки (по умолчанию - 6).
 
@@ -21,6 +29,17 @@ def generate_short_code(length: int = 6) -> str:
     if length < 1 or not isinstance(length, int):
         raise ValueError("Длина генерируемой строки должна быть натуральным числом (от 1 и более)")
 
-    generated_short_code = "".join(choice(CHARSET) for _ in range(length))
+    generated_short_code = bytearray()
+
+    # С запасом в 2 раза одного вызова почти всегда достаточно (отбрасывается ~16% значений)
+    while len(generated_short_code) < length:
+        for byte in token_bytes(length * 2):
+            value = byte & _MASK
+
+            if value < _CHARSET_SIZE:
+                generated_short_code.append(_CHARSET_BYTES[value])
+
+                if len(generated_short_code) == length:
+                    break
 
-    return generated_short_code
+    return generated_short_code.decode("ascii")
@@ -2,6 +2,9 @@
 
 from src.api.core.config import settings
 
+# Базовая часть короткой ссылки не меняется во время работы приложения, поэтому вычисляем ее один раз
+_BASE_URL: str = f"http://{settings.API_HOST}:{settings.API_PORT}/"
+
 
 def format_short_url(short_code: str) -> str:
     """
@@ -13,5 +16,4 @@ def format_short_url(short_code: str) -> str:
     Returns:
         str: Полный URL с использованием шорт кода.
     """
-    full_url = f"http://{settings.API_HOST}:{settings.API_PORT}/{short_code}"
-    return full_url
+    return _BASE_URL + short_code
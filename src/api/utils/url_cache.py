@@ -0,0 +1,62 @@
+"""Модуль с in-process LRU кэшем для соответствия шорт кода и оригинальной ссылки."""
+
+from collections import OrderedDict
+
+
+class UrlCache:
+    """
+    Ограниченный по размеру LRU кэш `short_code -> original_url`.
+
+    Соответствие шорт кода и оригинальной ссылки не меняется после создания,
+    поэтому записи не нуждаются в сроке жизни и вытесняются только при переполнении.
+    Кэш используется в рамках одного event loop, поэтому не требует блокировок.
+
+    Attributes:
+        max_size (int): Максимальное количество записей в кэше.
+    """
+
+    __slots__ = ("max_size", "_data")
+
+    def __init__(self, max_size: int):
+        """
+        Инициализирует пустой кэш.
+
+        Args:
+            max_size (int): Максимальное количество записей в кэше (0 - кэш отключен).
+        """
+        self.max_size = max_size
+        self._data: OrderedDict[str, str] = OrderedDict()
+
+    def get(self, short_code: str) -> str | None:
+        """
+        Возвращает оригинальную ссылку из кэша и помечает запись как недавно использованную.
+
+        Args:
+            short_code (str): Шорт код (случайно сгенерированная строка).
+
+        Returns:
+            str | None: Оригинальная ссылка или None, если записи нет в кэше.
+        """
+        original_url = self._data.get(short_code)
+
+        if original_url is not None:
+            self._data.move_to_end(short_code)
+
+        return original_url
+
+    def set(self, short_code: str, original_url: str) -> None:
+        """
+        Добавляет запись в кэш, вытесняя самую давно использованную при переполнении.
+
+        Args:
+            short_code (str): Шорт код (случайно сгенерированная строка).
+            original_url (str): Оригинальная пользовательская ссылка.
+        """
+        if self.max_size <= 0:
+            return
+
+        self._data[short_code] = original_url
+        self._data.move_to_end(short_code)
+
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
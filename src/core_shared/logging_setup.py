@@ -2,38 +2,92 @@
 
 import os
 import sys
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger as global_loguru_logger
-from pydantic import BaseModel, Field
 
 # Импортируем Logger только для проверки типов
 if TYPE_CHECKING:
     from loguru import Logger
 
 
-class LogConfig(BaseModel):
-    """Конфигурация логирования."""
+@dataclass(frozen=True, slots=True)
+class LogConfig:
+    """
+    Конфигурация логирования.
+
+    Значения задаются в коде (не пользовательский ввод), поэтому валидация не нужна.
+    Изменение - через `dataclasses.replace`.
+
+    Attributes:
+        level: Уровень логирования.
+        format: Формат лог сообщения.
+        rotation: Ротация лог-файлов по размеру.
+        retention: Время хранения лог-файлов.
+        serialize: Сериализовать логи в JSON.
+        enable_debug_mode: Включить режим разработки/тестирования.
+        enable_file_logging: Включить логирование в файл.
+        log_file_path: Путь к файлу логов.
+    """
 
-    level: str = Field(default="INFO", description="Уровень логирования")
-    format: str = Field(
-        default=(
-            "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-            "<level>{level: <8}</level> | "
-            "<cyan>{extra[service_name]}</cyan> | "
-            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
-        ),
-        description="Формат лог сообщения",
-    )
-    rotation: str = Field(default="10 MB", description="Ротация лог-файлов по размеру")
-    retention: str = Field(default="7 days", description="Время хранения лог-файлов")
-    serialize: bool = Field(default=False, description="Сериализовать логи в JSON")
-    enable_debug_mode: bool = Field(default=False, description="Включить режим разработки/тестирования")
-    enable_file_logging: bool = Field(default=True, description="Включить логирование в файл")
-    log_file_path: str = Field(
-        default="logs/{service_name}_{time:YYYY-MM-DD}.log",
-        description="Путь к файлу логов",
+    level: str = "INFO"
+    format: str = (
+        "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+        "<level>{level: <8}</level> | "
+        "<cyan>{extra[service_name]}</cyan> | "
+        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
     )
+    rotation: str = "10 MB"
+    retention: str = "7 days"
+    serialize: bool = False
+    enable_debug_mode: bool = False
+    enable_file_logging: bool = True
+    log_file_path: str = "logs/{service_name}_{time:YYYY-MM-DD}.log"
+
+
+# Конфигурация по умолчанию (создается один раз при импорте модуля)
+_DEFAULT_LOG_CONFIG = LogConfig()
+
+# Директории для логов, уже созданные в этом процессе
+_created_dirs: set[str] = set()
+
+# Параметры последней настройки (имя сервиса, конфигурация) и настроенный логгер
+_last_setup: tuple[tuple[str, LogConfig], "Logger"] | None = None
+
+
+# Стандартные уровни Loguru: уже заданные в верхнем регистре значения используются без вызова `upper()`
+_CANONICAL_LEVELS = frozenset(("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"))
+
+
+# Фильтр для консольного обработчика: отсекает стандартные логи доступа uvicorn
+# (словарь Loguru проверяет сам, без вызова Python-функции на каждую запись)
+_CONSOLE_FILTER: dict[str | None, str | int | bool] = {"uvicorn.access": False}
+
+
+@lru_cache(maxsize=32)
+def _resolve_log_path(template: str, service_name: str) -> tuple[str, str]:
+    """
+    Подставляет имя сервиса в шаблон пути к файлу логов и вычисляет директорию логов.
+
+    Args:
+        template: Шаблон пути к файлу логов (может содержать `{service_name}` и `{time...}`).
+        service_name: Имя сервиса.
+
+    Returns:
+        Кортеж (путь к файлу логов, директория логов).
+    """
+    # Меняем service_name
+    log_file_path_formatted = template.replace("{service_name}", service_name.lower())
+
+    # Вычисляем директорию: отсекаем динамическую часть пути, начиная с "{time" (в том числе "{time:...}"),
+    # и берем все до последнего "/" (если в пути нет {time}, это просто директория файла)
+    static_part = log_file_path_formatted.partition("{time")[0]
+    log_dir = static_part.rpartition("/")[0]
+
+    return log_file_path_formatted, log_dir
 
 
 def setup_logger(
@@ -43,12 +97,14 @@ def setup_logger(
     log_rotation_override: str | None = None,
     log_retention_override: str | None = None,
     debug_mode_override: bool | None = None,
+    force: bool = False,
 ) -> "Logger":
     """
     Настраивает Loguru логгер для указанного сервиса и возвращает его экземпляр.
 
     Удаляет все предыдущие обработчики перед добавлением новых,
     чтобы избежать дублирования при повторных вызовах (например, в тестах).
+    Повторный вызов с теми же параметрами возвращает уже настроенный логгер без пересоздания обработчиков.
 
     Args:
         service_name: Имя сервиса (например, "API", "Alembic").
@@ -57,27 +113,47 @@ def setup_logger(
         log_rotation_override: Переопределяет ротацию лог-файлов по размеру (в мегабайтах) из конфигурации.
         log_retention_override: Переопределяет время хранения лог-файлов (в днях) из конфигурации.
         debug_mode_override: Переопределяет включение режима разработки/тестирования из конфигурации.
+        force: Перенастроить логгер, даже если он уже настроен с теми же параметрами.
 
     Returns:
         Сконфигурированный экземпляр логгера Loguru.
     """
-    if log_config is None:
-        current_config = LogConfig()
-    else:
-        current_config = log_config
+    # Собираем переопределения (только переданные значения)
+    overrides: dict[str, Any] = {}
 
-    # Применяем переопределения, если они есть
     if log_level_override:
-        current_config.level = log_level_override.upper()
+        overrides["level"] = (
+            log_level_override if log_level_override in _CANONICAL_LEVELS else log_level_override.upper()
+        )
 
     if log_rotation_override:
-        current_config.rotation = log_rotation_override
+        overrides["rotation"] = log_rotation_override
 
     if log_retention_override:
-        current_config.retention = log_retention_override
+        overrides["retention"] = log_retention_override
 
     if debug_mode_override:
-        current_config.enable_debug_mode = debug_mode_override
+        overrides["enable_debug_mode"] = debug_mode_override
+
+    # Без переопределений используем конфигурацию как есть (по умолчанию - общий экземпляр),
+    # иначе создаем копию с переопределениями (конфигурация неизменяема)
+    base_config = log_config if log_config is not None else _DEFAULT_LOG_CONFIG
+    current_config = replace(base_config, **overrides) if overrides else base_config
+
+    # Если логгер уже настроен с теми же параметрами, не пересоздаем обработчики (и не переоткрываем файл логов)
+    global _last_setup
+    setup_key = (service_name, current_config)
+
+    if not force and _last_setup is not None and _last_setup[0] == setup_key:
+        return _last_setup[1]
+
+    # Числовой уровень вычисляем один раз для всех обработчиков
+    # Неизвестный уровень - ValueError сразу, до удаления текущих обработчиков (прежняя настройка остается рабочей)
+    level_no = global_loguru_logger.level(current_config.level).no
+
+    # Сбрасываем запомненную настройку до удаления обработчиков: если настройка ниже упадет,
+    # повторный вызов не вернет из кэша логгер без обработчиков
+    _last_setup = None
 
     # Удаляем все предыдущие обработчики, чтобы избежать дублирования
     global_loguru_logger.remove()
@@ -90,41 +166,37 @@ def setup_logger(
     # Обработчик для вывода в консоль (stderr)
     service_specific_logger.add(
         sys.stderr,
-        level=current_config.level,
+        level=level_no,
         format=current_config.format,
         serialize=current_config.serialize,
-        filter=lambda record: record["name"] != "uvicorn.access",  # Фильтруем стандартные логи доступа uvicorn
-        colorize=True,  # Цветной вывод
+        filter=_CONSOLE_FILTER,  # Фильтруем стандартные логи доступа uvicorn
+        # Цвет только для терминала (не для pipe/Docker/JSON), с учетом соглашения NO_COLOR
+        colorize=not current_config.serialize and sys.stderr.isatty() and not os.environ.get("NO_COLOR"),
         backtrace=current_config.enable_debug_mode,  # Подробный трейсбек в режиме разработки/тестирования
         diagnose=current_config.enable_debug_mode,  # Диагностика переменных в режиме разработки/тестирования
     )
 
     # Обработчик для записи в файл (по умолчанию включен)
     if current_config.enable_file_logging:
-        # Меняем service_name
-        log_file_path_formatted = current_config.log_file_path.replace("{service_name}", service_name.lower())
-
-        # Вычисляем директорию. Разбиваем строку по "{time}", чтобы отсечь динамическую часть имени файла.
-        # Если в пути нет {time}, берем просто директорию от файла.
-        if "{time}" in log_file_path_formatted:
-            log_dir = os.path.dirname(log_file_path_formatted.split("{time}")[0])
-        else:
-            log_dir = os.path.dirname(log_file_path_formatted)
-
-        # Пытаемся создать директорию
-        if log_dir and not os.path.exists(log_dir):
-            try:
-                os.makedirs(log_dir, exist_ok=True)
-            except OSError as exc:
-                # Если не удалось создать директорию, логируем через stderr
-                service_specific_logger.warning(
-                    f"Не удалось создать директорию для логов '{log_dir}': {exc}. "
-                    f"Логирование в файл для для сервиса '{service_name}' будет отключено."
-                )
+        # Путь к файлу и директория логов (вычисляются один раз для пары шаблон/сервис)
+        log_file_path_formatted, log_dir = _resolve_log_path(current_config.log_file_path, service_name)
+
+        # Пытаемся создать директорию (если она уже существует, ошибки не будет)
+        # Директории, созданные при предыдущих вызовах, повторно не проверяем
+        try:
+            if log_dir and log_dir not in _created_dirs:
+                Path(log_dir).mkdir(parents=True, exist_ok=True)
+                _created_dirs.add(log_dir)
+        except OSError as exc:
+            # Если не удалось создать директорию, логируем через stderr
+            service_specific_logger.warning(
+                f"Не удалось создать директорию для логов '{log_dir}': {exc}. "
+                f"Логирование в файл для для сервиса '{service_name}' будет отключено."
+            )
         else:
             service_specific_logger.add(
                 log_file_path_formatted,
-                level=current_config.level,
+                level=level_no,
                 format=current_config.format,
                 rotation=current_config.rotation,
                 retention=current_config.retention,
@@ -140,6 +212,8 @@ def setup_logger(
         f"Loguru сконфигурирован. Уровень: {current_config.level}. Логирование в файл: {file_logging_status}."
     )
 
+    _last_setup = (setup_key, service_specific_logger)
+
     return service_specific_logger
 
 